@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Collection, Iterable, Iterator
 from typing import TYPE_CHECKING
 
 from dask.typing import Key
@@ -9,6 +11,194 @@ if TYPE_CHECKING:
     # Circular import
     from distributed.scheduler import Transition
 
+#: Message components that :func:`worker_story` looks into
+_CONTAINER_TYPES: frozenset[type] = frozenset({tuple, list, set})
+
+
+class _LazyLog(deque):
+    """A deque that lets subclasses maintain a structure derived from its entries,
+    such as an index, without slowing down appending
+
+    ``append`` and ``extend`` are deque's own, and the derived structure is only
+    brought up to date when it's needed. Entries are recognized by identity, so
+    the same object must not be appended twice; every log entry carries its own
+    timestamp, which guarantees that.
+    """
+
+    #: Newest entry that the derived structure covers
+    _last: object
+
+    def __init__(self, iterable: Iterable = (), maxlen: int | None = None):
+        super().__init__(iterable, maxlen)
+        self._last = None
+
+    def __reduce__(self):
+        return type(self), (list(self), self.maxlen)
+
+    def _new_entries(self) -> tuple[list, bool]:
+        """Return the entries appended since the previous call, oldest first
+
+        The second element of the result is True if none of the entries returned
+        by previous calls are left, because the log was cleared or they've all
+        been evicted; in that case all entries are returned.
+        """
+        last = self._last
+        fresh = []
+        reset = True
+        if last is not None:
+            for entry in reversed(self):
+                if entry is last:
+                    reset = False
+                    break
+                fresh.append(entry)
+        if reset:
+            fresh = list(self)
+        else:
+            fresh.reverse()
+        self._last = self[-1] if self else None
+        return fresh, reset
+
+
+class TransitionLog(_LazyLog):
+    """Bounded log of scheduler transitions, indexed by key
+
+    Behaves like ``deque(maxlen=maxlen)``. Queries through :func:`scheduler_story`
+    additionally maintain an inverted index from every task key mentioned by a
+    transition (either as the transitioning key or as a recommendation) to the
+    absolute positions of the matching entries, so that they don't have to scan
+    the whole log. Each query only indexes the entries appended since the
+    previous one; appending costs nothing extra.
+    """
+
+    #: Absolute positions of the entries mentioning each key, oldest first. May
+    #: include positions of entries that have been evicted since.
+    _index: dict[Key, list[int]]
+    #: Absolute position of the next entry to be indexed
+    _next: int
+    #: Absolute position of the oldest entry in the index
+    _base: int
+
+    def __init__(self, iterable: Iterable[Transition] = (), maxlen: int | None = None):
+        super().__init__(iterable, maxlen)
+        self._index = {}
+        self._next = 0
+        self._base = 0
+
+    def _update_index(self) -> int:
+        """Index the entries appended since the previous call and return the
+        absolute position of the leftmost entry of the log"""
+        fresh, reset = self._new_entries()
+        n = len(self)
+        first = self._next + len(fresh) - n
+        if reset or first - self._base > n:
+            # Start over rather than let positions of evicted entries pile up
+            if not reset:
+                fresh = list(self)
+            self._index = {}
+            self._base = self._next = first = self._next + len(fresh) - n
+
+        index = self._index
+        pos = self._next
+        for t in fresh:
+            key = t[0]
+            positions = index.get(key)
+            if positions is None:
+                index[key] = [pos]
+            else:
+                positions.append(pos)
+            for k in t[3]:
+                if k != key:
+                    positions = index.get(k)
+                    if positions is None:
+                        index[k] = [pos]
+                    else:
+                        positions.append(pos)
+            pos += 1
+        self._next = pos
+        return first
+
+    def story_iter(self, keys_or_stimuli: set[Key | str]) -> Iterator[Transition]:
+        first = self._update_index()
+        index = self._index
+        if len(keys_or_stimuli) == 1:
+            # Positions of a single key are already unique and sorted
+            (k,) = keys_or_stimuli
+            positions = index.get(k, [])
+            positions = positions[bisect_left(positions, first) :]
+        else:
+            found: set[int] = set()
+            for k in keys_or_stimuli:
+                found.update(index.get(k, ()))
+            positions = sorted(pos for pos in found if pos >= first)
+        if not positions:
+            return iter(())
+        # Indexing into the middle of a deque is O(n); copy it once instead
+        entries = list(self)
+        return (entries[pos - first] for pos in positions)
+
+
+class WorkerLog(_LazyLog):
+    """Bounded log of worker events
+
+    Behaves like ``deque(maxlen=maxlen)``. Queries through :func:`worker_story`
+    additionally compute a 64-bit Bloom signature of the components of every
+    message, which lets them skip most non-matching messages without inspecting
+    them. Signatures are cached, so each message is only signed once, the first
+    time the log is queried after it was appended; appending costs nothing extra.
+    """
+
+    _signatures: deque[int]
+
+    def __init__(self, iterable: Iterable[tuple] = (), maxlen: int | None = None):
+        super().__init__(iterable, maxlen)
+        self._signatures = deque(maxlen=maxlen)
+
+    def _update_signatures(self) -> deque[int]:
+        """Sign the messages appended since the previous call and return the
+        signatures of all messages in the log"""
+        fresh, reset = self._new_entries()
+        if reset:
+            self._signatures.clear()
+        self._signatures.extend(map(_signature, fresh))
+        return self._signatures
+
+
+#: Signature that matches any query
+_ALL_BITS = (1 << 64) - 1
+#: Containers longer than this aren't hashed element by element
+_MAX_SIGNED_ELEMENTS = 32
+
+
+def _signature(msg: tuple) -> int:
+    """Bloom signature of the components of a worker log message, including the
+    elements of its tuple, list and set components.
+
+    A message can only match a tag in :func:`worker_story` if the bit of the hash
+    of the tag is set in the signature. Messages with large containers, e.g. a
+    free-keys with thousands of keys, match anything instead.
+    """
+    sig = 0
+    for c in msg:
+        typ = type(c)
+        if typ in _CONTAINER_TYPES:
+            if len(c) > _MAX_SIGNED_ELEMENTS:
+                return _ALL_BITS
+            for x in c:
+                try:
+                    sig |= 1 << (hash(x) & 63)
+                except TypeError:
+                    pass
+            if typ is not tuple:
+                continue
+        elif typ is dict:
+            # Never matched by worker_story
+            continue
+        try:
+            sig |= 1 << (hash(c) & 63)
+        except TypeError:
+            pass
+    return sig
+
 
 def scheduler_story(
     keys_or_stimuli: set[Key | str], transition_log: Iterable[Transition]
@@ -26,12 +216,31 @@ def scheduler_story(
     Returns
     -------
     story : list[tuple]
+
+    See Also
+    --------
+    scheduler_story_iter
     """
-    return [
+    return list(scheduler_story_iter(keys_or_stimuli, transition_log))
+
+
+def scheduler_story_iter(
+    keys_or_stimuli: set[Key | str], transition_log: Iterable[Transition]
+) -> Iterator[Transition]:
+    """Lazy version of :func:`scheduler_story`
+
+    The log must not be modified until the iterator is exhausted or discarded.
+    """
+    if isinstance(transition_log, TransitionLog):
+        return transition_log.story_iter(keys_or_stimuli)
+    if len(keys_or_stimuli) == 1:
+        (k,) = keys_or_stimuli
+        return (t for t in transition_log if t[0] == k or k in t[3])
+    return (
         t
         for t in transition_log
-        if t[0] in keys_or_stimuli or keys_or_stimuli.intersection(t[3])
-    ]
+        if t[0] in keys_or_stimuli or not keys_or_stimuli.isdisjoint(t[3])
+    )
 
 
 def worker_story(keys_or_stimuli: Collection[Key | str], log: Iterable[tuple]) -> list:
@@ -48,15 +257,54 @@ def worker_story(keys_or_stimuli: Collection[Key | str], log: Iterable[tuple]) -
     Returns
     -------
     story : list[str]
+
+    See Also
+    --------
+    worker_story_iter
     """
-    return [
-        msg
-        for msg in log
-        if any(key in msg for key in keys_or_stimuli)
-        or any(
-            key in c
-            for key in keys_or_stimuli
-            for c in msg
-            if isinstance(c, (tuple, list, set))
-        )
-    ]
+    return list(worker_story_iter(keys_or_stimuli, log))
+
+
+def worker_story_iter(
+    keys_or_stimuli: Collection[Key | str], log: Iterable[tuple]
+) -> Iterator[tuple]:
+    """Lazy version of :func:`worker_story`
+
+    The log must not be modified until the iterator is exhausted or discarded.
+    """
+    tags = frozenset(keys_or_stimuli)
+    if isinstance(log, WorkerLog):
+        # Skip messages whose signature rules out any match
+        query = 0
+        for tag in tags:
+            query |= 1 << (hash(tag) & 63)
+        signatures = log._update_signatures()
+        log = (msg for msg, sig in zip(log, signatures) if sig & query)
+
+    for msg in log:
+        for c in msg:
+            try:
+                if c in tags:
+                    break
+            except TypeError:
+                # Unhashable element, e.g. a dict of recommendations
+                pass
+            if type(c) in _CONTAINER_TYPES and _intersects(tags, c):
+                break
+        else:
+            continue
+        yield msg
+
+
+def _intersects(tags: frozenset, c: Iterable) -> bool:
+    try:
+        return not tags.isdisjoint(c)
+    except TypeError:
+        # c contains unhashable elements; those can never match a key
+        for x in c:
+            try:
+                if x in tags:
+                    return True
+            except TypeError:
+                pass
+        return False
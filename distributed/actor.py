@@ -3,9 +3,10 @@ from __future__ import annotations
 import abc
 import functools
 import threading
-from collections.abc import Awaitable, Generator
+from collections.abc import Awaitable, Callable, Generator
 from dataclasses import dataclass
 from datetime import timedelta
+from types import MethodType
 from typing import Generic, Literal, NoReturn, TypeVar
 
 from tornado.ioloop import IOLoop
@@ -59,6 +60,17 @@ class Actor(TaskRef):
     2
     """
 
+    # Attributes are looked up on every method call through __getattr__
+    __slots__ = (
+        "_cls",
+        "_address",
+        "_key",
+        "_future",
+        "_worker",
+        "_client",
+        "__weakref__",
+    )
+
     def __init__(self, cls, address, key, worker=None):
         super().__init__(key)
         self._cls = cls
@@ -165,37 +177,7 @@ class Actor(TaskRef):
         attr = getattr(self._cls, key)
 
         if callable(attr):
-
-            @functools.wraps(attr)
-            def func(*args, **kwargs):
-                async def run_actor_function_on_worker():
-                    try:
-                        result = await self._worker_rpc.actor_execute(
-                            function=key,
-                            actor=self.key,
-                            args=[to_serialize(arg) for arg in args],
-                            kwargs={k: to_serialize(v) for k, v in kwargs.items()},
-                        )
-                    except OSError:
-                        if self._future and not self._future.done():
-                            await self._future
-                            return await run_actor_function_on_worker()
-                        else:
-                            exc = OSError("Unable to contact Actor's worker")
-                            return _Error(exc)
-                    if result["status"] == "OK":
-                        return _OK(result["result"])
-                    return _Error(result["exception"])
-
-                actor_future = ActorFuture(io_loop=self._io_loop)
-
-                async def wait_then_set_result():
-                    actor_future._set_result(await run_actor_function_on_worker())
-
-                self._io_loop.add_callback(wait_then_set_result)
-                return actor_future
-
-            return func
+            return MethodType(_actor_method(self._cls, key, attr), self)
 
         else:
 
@@ -210,11 +192,82 @@ class Actor(TaskRef):
 
             return self._sync(get_actor_attribute_from_worker)
 
+    def _call_method(self, key, args, kwargs):
+        # Wrap the arguments once, rather than again on every retry
+        args = list(map(to_serialize, args))
+        kwargs = {k: to_serialize(v) for k, v in kwargs.items()} if kwargs else {}
+
+        async def run_actor_function_on_worker():
+            try:
+                result = await self._worker_rpc.actor_execute(
+                    function=key, actor=self.key, args=args, kwargs=kwargs
+                )
+            except OSError:
+                if self._future and not self._future.done():
+                    await self._future
+                    return await run_actor_function_on_worker()
+                else:
+                    exc = OSError("Unable to contact Actor's worker")
+                    return _Error(exc)
+            if result["status"] == "OK":
+                return _OK(result["result"])
+            return _Error(result["exception"])
+
+        actor_future = ActorFuture(io_loop=self._io_loop)
+
+        async def wait_then_set_result():
+            actor_future._set_result(await run_actor_function_on_worker())
+
+        self._io_loop.add_callback(wait_then_set_result)
+        return actor_future
+
     @property
     def client(self):
         return self._future.client
 
 
+class _ActorMethods(dict):
+    """Remote method dispatchers of an actor class, by method name
+
+    Only a cache; classes pickled by value, e.g. by cloudpickle, carry it over
+    empty.
+    """
+
+    def __reduce__(self):
+        return _ActorMethods, ()
+
+
+def _actor_method(cls: type, key: str, attr: Callable) -> Callable:
+    """Return a function that, bound to an :class:`Actor`, calls method ``key``
+    of the remote actor.
+
+    Dispatchers are built once per class and method, so that calling a method
+    on an Actor doesn't need to create a new closure and copy the metadata of
+    the wrapped method every time. They're stored on the actor class itself:
+    a dispatcher references its class through ``__wrapped__``, so a cache
+    outside the class would keep dynamically created classes alive.
+    """
+    methods = cls.__dict__.get("_dask_actor_methods")
+    if methods is None:
+        methods = _ActorMethods()
+        try:
+            cls._dask_actor_methods = methods  # type: ignore[attr-defined]
+        except (AttributeError, TypeError):
+            # e.g. a built-in or extension type; don't cache
+            pass
+    try:
+        return methods[key]
+    except KeyError:
+        pass
+
+    @functools.wraps(attr)
+    def func(self, *args, **kwargs):
+        return self._call_method(key, args, kwargs)
+
+    methods[key] = func
+    return func
+
+
 class ProxyRPC:
     """
     An rpc-like object that uses the scheduler's rpc to connect to a worker
@@ -262,6 +315,8 @@ class EagerActorFuture(BaseActorFuture[_T]):
     _result: _T
 
     def __await__(self) -> Generator[object, None, _T]:
+        # A generator that returns immediately is the cheapest awaitable; an
+        # already resolved asyncio.Future is about five times slower to await.
         return self._result
         yield  # type: ignore[unreachable]
 
@@ -12,7 +12,6 @@ import dask
 from dask.utils import parse_timedelta
 
 from distributed.core import CommClosedError
-from distributed.metrics import time
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +37,12 @@ class BatchedSend:
     On the other side, the recipient will get a message like the following::
 
         ['Hello,', 'world!']
+
+    Messages are buffered as Python objects and serialized only once per batch,
+    by the comm, when the batch is written. They are deliberately not
+    pre-serialized in :meth:`send`: inproc comms hand messages over by
+    reference without serializing them at all, and :func:`to_serialize` payloads
+    must be split into out-of-band frames for the batch as a whole.
     """
 
     # XXX why doesn't BatchedSend follow either the IOStream or Comm API?
@@ -46,7 +51,7 @@ class BatchedSend:
         # XXX is the loop arg useful?
         self.loop = loop or IOLoop.current()
         self.interval = parse_timedelta(interval, default="ms")
-        self.waker = locks.Event()
+        self.high_water = dask.config.get("distributed.comm.batch-high-water")
         self.stopped = locks.Event()
         self.please_stop = False
         self.buffer = []
@@ -54,16 +59,22 @@ class BatchedSend:
         self.message_count = 0
         self.batch_count = 0
         self.byte_count = 0
+        # Earliest time, on the IOLoop's clock, at which the next batch may be sent
         self.next_deadline = None
         self.recent_message_log = deque(
             maxlen=dask.config.get("distributed.admin.low-level-log-length")
         )
         self.serializers = serializers
         self._consecutive_failures = 0
+        # Timeout calling _flush at _flush_deadline, if one is pending
+        self._flush_handle = None
+        self._flush_deadline = 0.0
+        # Task writing the current batch to the comm, if one is in flight
+        self._write_task = None
 
     def start(self, comm):
         self.comm = comm
-        self.loop.add_callback(self._background_send)
+        self.loop.add_callback(self._maybe_flush)
 
     def closed(self):
         return self.comm and self.comm.closed()
@@ -76,74 +87,86 @@ class BatchedSend:
 
     __str__ = __repr__
 
-    @gen.coroutine
-    def _background_send(self):
-        while not self.please_stop:
-            try:
-                yield self.waker.wait(self.next_deadline)
-                self.waker.clear()
-            except gen.TimeoutError:
-                pass
-            if not self.buffer:
-                # Nothing to send
-                self.next_deadline = None
-                continue
-            if self.next_deadline is not None and time() < self.next_deadline:
-                # Send interval not expired yet
-                continue
-            payload, self.buffer = self.buffer, []
-            self.batch_count += 1
-            self.next_deadline = time() + self.interval
-            try:
-                # NOTE: Since `BatchedSend` doesn't have a handle on the running
-                # `_background_send` coroutine, the only thing with a reference to this
-                # coroutine is the event loop itself. If the event loop stops while
-                # we're waiting on a `write`, the `_background_send` coroutine object
-                # may be garbage collected. If that happens, the `yield coro` will raise
-                # `GeneratorExit`. But because this is an old-school `gen.coroutine`,
-                # and we're using `yield` and not `await`, the `write` coroutine object
-                # will not actually have been awaited, and it will remain sitting around
-                # for someone to retrieve it. At interpreter exit, this will warn
-                # sommething like `RuntimeWarning: coroutine 'TCP.write' was never
-                # awaited`. By using the `closing` contextmanager, the `write` coroutine
-                # object is always cleaned up, even if `yield` raises `GeneratorExit`.
-                with contextlib.closing(
-                    self.comm.write(
-                        payload, serializers=self.serializers, on_error="raise"
-                    )
-                ) as coro:
-                    nbytes = yield coro
-                if nbytes < 1e6:
-                    self.recent_message_log.append(payload)
-                else:
-                    self.recent_message_log.append("large-message")
-                self.byte_count += nbytes
-            except CommClosedError:
-                logger.info("Batched Comm Closed %r", self.comm, exc_info=True)
-                break
-            except Exception:
-                # We cannot safely retry self.comm.write, as we have no idea
-                # what (if anything) was actually written to the underlying stream.
-                # Re-writing messages could result in complete garbage (e.g. if a frame
-                # header has been written, but not the frame payload), therefore
-                # the only safe thing to do here is to abort the stream without
-                # any attempt to re-try `write`.
-                logger.exception("Error in batched write")
-                break
-            finally:
-                payload = None  # lose ref
+    def _maybe_flush(self):
+        """Schedule the buffer to be sent once the interval since the previous
+        batch has expired, or on the next event loop iteration if the buffer hit
+        the high-water mark.
+
+        There is at most one batch in flight at any time. Once it has been
+        written, this is called again for whatever was buffered in the meantime.
+        """
+        if (
+            self.comm is None
+            or self.please_stop
+            or self._write_task is not None
+            or not self.buffer
+        ):
+            return
+        if (
+            self.next_deadline is not None
+            and self.next_deadline > self.loop.time()
+            and len(self.buffer) < self.high_water
+        ):
+            deadline = self.next_deadline
+        else:
+            deadline = 0
+        if self._flush_handle is not None:
+            if deadline >= self._flush_deadline:
+                return
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._flush_deadline = deadline
+        if deadline:
+            self._flush_handle = self.loop.call_at(deadline, self._flush)
+        else:
+            # Don't go through the timer heap when the batch is due already
+            self._flush_handle = self.loop.asyncio_loop.call_soon(self._flush)
+
+    def _flush(self):
+        self._flush_handle = None
+        if self.please_stop or self._write_task is not None or not self.buffer:
+            return
+        payload, self.buffer = self.buffer, []
+        self.batch_count += 1
+        self.next_deadline = self.loop.time() + self.interval
+        self._write_task = self.loop.asyncio_loop.create_task(self._write(payload))
+
+    async def _write(self, payload):
+        try:
+            nbytes = await self.comm.write(
+                payload, serializers=self.serializers, on_error="raise"
+            )
+            if nbytes < 1e6:
+                self.recent_message_log.append(payload)
+            else:
+                self.recent_message_log.append("large-message")
+            self.byte_count += nbytes
+        except CommClosedError:
+            logger.info("Batched Comm Closed %r", self.comm, exc_info=True)
+        except Exception:
+            # We cannot safely retry self.comm.write, as we have no idea
+            # what (if anything) was actually written to the underlying stream.
+            # Re-writing messages could result in complete garbage (e.g. if a frame
+            # header has been written, but not the frame payload), therefore
+            # the only safe thing to do here is to abort the stream without
+            # any attempt to re-try `write`.
+            logger.exception("Error in batched write")
         else:
-            # nobreak. We've been gracefully closed.
-            self.stopped.set()
+            self._write_task = None
+            if self.please_stop:
+                # We've been gracefully closed.
+                self.stopped.set()
+            else:
+                self._maybe_flush()
             return
 
-        # If we've reached here, it means `break` was hit above and
-        # there was an exception when using `comm`.
+        # If we've reached here, there was an exception when using `comm`.
         # We can't close gracefully via `.close()` since we can't send messages.
         # So we just abort.
         # This means that any messages in our buffer our lost.
         # To propagate exceptions, we rely on subsequent `BatchedSend.send`
         # calls to raise CommClosedErrors.
+        self._write_task = None
         self.stopped.set()
         self.abort()
 
@@ -152,14 +175,18 @@ class BatchedSend:
 
         This completes quickly and synchronously
         """
+        # Don't cache this: the comm may be closed from the other end at any time
         if self.comm is not None and self.comm.closed():
             raise CommClosedError(f"Comm {self.comm!r} already closed.")
 
         self.message_count += len(msgs)
         self.buffer.extend(msgs)
-        # Avoid spurious wakeups if possible
-        if self.next_deadline is None:
-            self.waker.set()
+        # Nothing to do if a batch is already in flight or scheduled, unless the
+        # buffer grew so large that it should be sent without waiting any longer
+        if (self._flush_handle is None and self._write_task is None) or len(
+            self.buffer
+        ) >= self.high_water:
+            self._maybe_flush()
 
     @gen.coroutine
     def close(self, timeout=None):
@@ -170,13 +197,22 @@ class BatchedSend:
         if self.comm is None:
             return
         self.please_stop = True
-        self.waker.set()
-        yield self.stopped.wait(timeout=timeout)
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._write_task is not None:
+            yield self.stopped.wait(timeout=timeout)
         if not self.comm.closed():
             try:
                 if self.buffer:
                     self.buffer, payload = [], self.buffer
-                    # See note in `_background_send` for explanation of `closing`.
+                    # NOTE: If the event loop stops while we're waiting on a `write`,
+                    # this old-school `gen.coroutine` may be garbage collected, which
+                    # raises `GeneratorExit` at the `yield`. The `write` coroutine
+                    # object would then never be awaited and warn something like
+                    # `RuntimeWarning: coroutine 'TCP.write' was never awaited` at
+                    # interpreter exit. The `closing` contextmanager makes sure it is
+                    # always cleaned up.
                     with contextlib.closing(
                         self.comm.write(
                             payload, serializers=self.serializers, on_error="raise"
@@ -192,6 +228,8 @@ class BatchedSend:
             return
         self.please_stop = True
         self.buffer = []
-        self.waker.set()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         if not self.comm.closed():
             self.comm.abort()
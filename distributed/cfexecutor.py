@@ -4,7 +4,6 @@ import concurrent.futures as cf
 import weakref
 
 from tlz import merge
-from tornado import gen
 
 from dask.utils import parse_timedelta
 
@@ -12,13 +11,12 @@ from distributed.metrics import time
 from distributed.utils import TimeoutError, sync
 
 
-@gen.coroutine
-def _cascade_future(future, cf_future):
+async def _cascade_future(future, cf_future):
     """
     Coroutine that waits on Dask future, then transmits its outcome to
     cf_future.
     """
-    result = yield future._result(raiseit=False)
+    result = await future._result(raiseit=False)
     status = future.status
     if status == "finished":
         cf_future.set_result(result)
@@ -34,11 +32,10 @@ def _cascade_future(future, cf_future):
             cf_future.set_exception(exc)
 
 
-@gen.coroutine
-def _wait_on_futures(futures):
+async def _wait_on_futures(futures):
     for fut in futures:
         try:
-            yield fut
+            await fut
         except Exception:
             pass
 
@@ -27,7 +27,11 @@ def main(args: list, spec: str, spec_file: str) -> None:
     _spec = {}
     if spec_file:
         with open(spec_file) as f:
-            _spec.update(yaml.safe_load(f))
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            # Parse documents one at a time; later ones override earlier ones
+            for doc in yaml.load_all(f, Loader=loader):
+                if doc is not None:  # e.g. a trailing "---"
+                    _spec.update(doc)
 
     if spec:
         _spec.update(json.loads(spec))
@@ -76,6 +76,40 @@ async def test_file(c, s, tmp_path):
         assert w["nthreads"] == 3
 
 
+@gen_cluster(client=True, nthreads=[])
+async def test_file_multiple_documents(c, s, tmp_path):
+    fn = str(tmp_path / "foo.yaml")
+    with open(fn, "w") as f:
+        yaml.dump_all(
+            [
+                {
+                    "cls": "dask.distributed.Worker",
+                    "opts": {"nanny": False, "nthreads": 3, "name": "foo"},
+                },
+                # Later documents override earlier ones
+                {"opts": {"nanny": False, "nthreads": 2, "name": "bar"}},
+            ],
+            f,
+        )
+        f.write("---\n")  # An empty document
+    with popen(
+        [
+            sys.executable,
+            "-m",
+            "dask",
+            "spec",
+            s.address,
+            "--spec-file",
+            fn,
+        ]
+    ):
+        await c.wait_for_workers(1)
+        info = await c.scheduler.identity()
+        [w] = info["workers"].values()
+        assert w["name"] == "bar"
+        assert w["nthreads"] == 2
+
+
 def test_errors():
     with popen(
         [
@@ -4502,7 +4502,9 @@ class Client(SyncMethodMixin):
         ----------
         filename:
             The path or URL to write to. The appropriate file suffix (``.msgpack.gz`` or
-            ``.yaml``) will be appended automatically.
+            ``.yaml``) will be appended automatically. To compress a msgpack dump
+            with zstd rather than gzip, pass a filename ending in ``.msgpack.zst``
+            (requires the ``zstandard`` package).
 
             Must be a path supported by :func:`fsspec.open` (like ``s3://my-bucket/cluster-dump``,
             or ``cluster-dumps/dump``). See ``write_from_scheduler`` to control whether
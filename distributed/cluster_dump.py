@@ -12,22 +12,53 @@ import msgpack
 
 from dask.typing import Key
 
-from distributed._stories import scheduler_story as _scheduler_story
-from distributed._stories import worker_story as _worker_story
+from distributed._stories import scheduler_story_iter as _scheduler_story
+from distributed._stories import worker_story_iter as _worker_story
 
 DEFAULT_CLUSTER_DUMP_FORMAT: Literal["msgpack" | "yaml"] = "msgpack"
 DEFAULT_CLUSTER_DUMP_EXCLUDE: Collection[str] = ("run_spec",)
+#: Suffixes of msgpack cluster dumps. ``.msgpack.zst`` requires ``zstandard``.
+MSGPACK_SUFFIXES = (".msgpack.gz", ".msgpack.zst")
 
 
 def _tuple_to_list(node):
+    # A msgpack round trip decodes all tuples as lists, and walks the tree in C
+    # rather than with one Python call per node
+    try:
+        return msgpack.unpackb(msgpack.packb(node), strict_map_key=False)
+    except (TypeError, ValueError, OverflowError):
+        # Something msgpack can't encode
+        return _tuple_to_list_py(node)
+
+
+def _tuple_to_list_py(node):
     if isinstance(node, (list, tuple)):
-        return [_tuple_to_list(el) for el in node]
+        return [_tuple_to_list_py(el) for el in node]
     elif isinstance(node, dict):
-        return {k: _tuple_to_list(v) for k, v in node.items()}
+        return {k: _tuple_to_list_py(v) for k, v in node.items()}
     else:
         return node
 
 
+def _write_msgpack(state: Any, f: IO, depth: int = 2) -> None:
+    """Like ``msgpack.pack(state, f)``, but pack and write the values of nested
+    dicts, down to ``depth`` levels, one by one. This produces the same bytes
+    without ever holding the encoding of the whole dump in memory at once.
+    """
+    packer = msgpack.Packer()
+
+    def pack(node: Any, depth: int) -> None:
+        if depth and isinstance(node, dict):
+            f.write(packer.pack_map_header(len(node)))
+            for k, v in node.items():
+                f.write(packer.pack(k))
+                pack(v, depth - 1)
+        else:
+            f.write(packer.pack(node))
+
+    pack(state, depth)
+
+
 async def write_state(
     get_state: Callable[[], Awaitable[Any]],
     url: str,
@@ -35,12 +66,13 @@ async def write_state(
     **storage_options: dict[str, Any],
 ) -> None:
     "Await a cluster dump, then serialize and write it to a path"
+    writer: Callable[[dict, IO], None]
     if format == "msgpack":
         mode = "wb"
-        suffix = ".msgpack.gz"
-        if not url.endswith(suffix):
-            url += suffix
-        writer = msgpack.pack
+        # Default to gzip; zstd is used instead if asked for explicitly
+        if not url.endswith(MSGPACK_SUFFIXES):
+            url += MSGPACK_SUFFIXES[0]
+        writer = _write_msgpack
     elif format == "yaml":
         import yaml
 
@@ -52,7 +84,13 @@ async def write_state(
         def writer(state: dict, f: IO) -> None:
             # YAML adds unnecessary `!!python/tuple` tags; convert tuples to lists to avoid them.
             # Unnecessary for msgpack, since tuples and lists are encoded the same.
-            yaml.dump(_tuple_to_list(state), f)
+            # Emit with libyaml if available; the pure Python emitter is very slow
+            # on dumps of large clusters.
+            yaml.dump(
+                _tuple_to_list(state),
+                f,
+                Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            )
 
     else:
         raise ValueError(
@@ -60,7 +98,8 @@ async def write_state(
         )
 
     # Eagerly open the file to catch any errors before doing the full dump
-    # NOTE: `compression="infer"` will automatically use gzip via the `.gz` suffix
+    # NOTE: `compression="infer"` will automatically use gzip or zstd via the `.gz`
+    # or `.zst` suffix
     # This module is the only place where fsspec is used and it is a relatively
     # heavy import. Do lazy import to reduce import time
     import fsspec
@@ -79,7 +118,7 @@ def load_cluster_dump(url: str, **kwargs: Any) -> dict:
     ----------
     url : str
         Name of the disk artefact. This should have either a
-        ``.msgpack.gz`` or ``yaml`` suffix, depending on the dump format.
+        ``.msgpack.gz``, ``.msgpack.zst`` or ``yaml`` suffix, depending on the dump format.
     **kwargs :
         Extra arguments passed to :func:`fsspec.open`.
 
@@ -88,16 +127,21 @@ def load_cluster_dump(url: str, **kwargs: Any) -> dict:
     state : dict
         The cluster state at the time of the dump.
     """
-    if url.endswith(".msgpack.gz"):
+    if url.endswith(MSGPACK_SUFFIXES):
         mode = "rb"
         reader = msgpack.unpack
     elif url.endswith(".yaml"):
         import yaml
 
         mode = "r"
-        reader = yaml.safe_load
+
+        def reader(f: IO) -> dict:
+            return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
     else:
-        raise ValueError(f"url ({url}) must have a .msgpack.gz or .yaml suffix")
+        raise ValueError(
+            f"url ({url}) must have a .msgpack.gz, .msgpack.zst or .yaml suffix"
+        )
 
     kwargs.setdefault("compression", "infer")
     # This module is the only place where fsspec is used and it is a relatively
@@ -130,7 +174,7 @@ class DumpArtefact(Mapping):
         ----------
         url : str
             Name of the disk artefact. This should have either a
-            ``.msgpack.gz`` or ``yaml`` suffix, depending on the dump format.
+            ``.msgpack.gz``, ``.msgpack.zst`` or ``yaml`` suffix, depending on the dump format.
         **kwargs :
             Extra arguments passed to :func:`fsspec.open`.
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import itertools
 
 import dask
@@ -54,11 +55,14 @@ def normalize_address(addr: str) -> str:
     return unparse_address(*parse_address(addr))
 
 
+@functools.lru_cache(1000)
 def parse_host_port(
     address: str | tuple[str, int], default_port: str | int | None = None
 ) -> tuple[str, int]:
     """
     Parse an endpoint address given in the form "host:port".
+
+    Results are cached, as the same few addresses are parsed over and over.
     """
     if isinstance(address, tuple):
         return address
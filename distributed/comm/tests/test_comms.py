@@ -25,6 +25,7 @@ from distributed.comm import (
 )
 from distributed.comm.registry import backends, get_backend
 from distributed.comm.tcp import get_stream_address
+from distributed.comm.utils import _small_message_size
 from distributed.compatibility import asyncio_run
 from distributed.config import get_loop_factory
 from distributed.metrics import time
@@ -1458,3 +1459,16 @@ async def test_share_buffer_with_header(
     a = msg["np"]
     ha = get_host_array(a)
     assert (ha.nbytes == a.nbytes) == expect_separate_buffer
+
+
+def test_small_message_size():
+    msg = {"op": "task-finished", "key": ("x", 1), "nbytes": 8, "metadata": {}}
+    size = _small_message_size(msg)
+    assert size is not None
+    assert size >= len("task-finished")
+    assert _small_message_size({"op": "foo", "data": "x" * 10_000}) > 10_000
+    # Too many objects to be cheap
+    assert _small_message_size(list(range(100))) is None
+    # Arbitrary objects need sizeof
+    assert _small_message_size({"op": "foo", "data": object()}) is None
+    assert _small_message_size({"op": "foo", "data": to_serialize(1)}) is None
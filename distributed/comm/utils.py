@@ -19,6 +19,42 @@ if isinstance(OFFLOAD_THRESHOLD, str):
     OFFLOAD_THRESHOLD = parse_bytes(OFFLOAD_THRESHOLD)
 
 
+_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+_CONTAINER_TYPES = frozenset({list, tuple})
+
+
+def _small_message_size(msg, max_objects=64):
+    """Estimate the size of a small message made only of builtin scalars,
+    strings and containers, without going through :func:`safe_sizeof`
+
+    This covers most control messages and is much faster than sizeof's
+    dispatch. Returns None if the message contains anything else, or more than
+    ``max_objects`` objects, in which case it should be measured with sizeof.
+    """
+    size = 0
+    stack = [msg]
+    while stack:
+        max_objects -= 1
+        if max_objects < 0:
+            return None
+        obj = stack.pop()
+        typ = type(obj)
+        # Assume 64 bytes of overhead per object
+        size += 64
+        if typ in _SCALAR_TYPES:
+            continue
+        elif typ is str or typ is bytes:
+            size += len(obj)
+        elif typ is dict:
+            stack.extend(obj)
+            stack.extend(obj.values())
+        elif typ in _CONTAINER_TYPES:
+            stack.extend(obj)
+        else:
+            return None
+    return size
+
+
 async def to_frames(
     msg,
     allow_offload=True,
@@ -31,7 +67,8 @@ async def to_frames(
 
     def _to_frames():
         try:
-            return list(protocol.dumps(msg, **kwargs))
+            # protocol.dumps already returns a new list; don't copy it
+            return protocol.dumps(msg, **kwargs)
         except Exception as e:
             logger.info("Unserializable Message: %s", msg)
             logger.exception(e)
@@ -43,7 +80,9 @@ async def to_frames(
         # depending on compilation flags). The default default_size of
         # distributed.sizeof.safe_sizeof() is 1MB, which is less than the
         # OFFLOAD_THRESHOLD.
-        msg_size = safe_sizeof(msg, default_size=-1)
+        msg_size = _small_message_size(msg)
+        if msg_size is None:
+            msg_size = safe_sizeof(msg, default_size=-1)
         if msg_size == -1 or msg_size > OFFLOAD_THRESHOLD:
             return await offload(_to_frames)
 
@@ -54,7 +93,6 @@ async def from_frames(frames, deserialize=True, deserializers=None, allow_offloa
     """
     Unserialize a list of Distributed protocol frames.
     """
-    size = False
 
     def _from_frames():
         try:
@@ -62,6 +100,7 @@ async def from_frames(frames, deserialize=True, deserializers=None, allow_offloa
                 frames, deserialize=deserialize, deserializers=deserializers
             )
         except EOFError:
+            size = sum(map(nbytes, frames))
             if size > 1000:
                 datastr = "[too large to display]"
             else:
@@ -70,9 +109,14 @@ async def from_frames(frames, deserialize=True, deserializers=None, allow_offloa
             logger.error("truncated data stream (%d bytes): %s", size, datastr)
             raise
 
+    size = 0
     if allow_offload and deserialize and OFFLOAD_THRESHOLD:
-        size = sum(map(nbytes, frames))
-    if allow_offload and deserialize and OFFLOAD_THRESHOLD and size > OFFLOAD_THRESHOLD:
+        # Stop counting as soon as we know we're going to offload
+        for frame in frames:
+            size += nbytes(frame)
+            if size > OFFLOAD_THRESHOLD:
+                break
+    if size and size > OFFLOAD_THRESHOLD:
         res = await offload(_from_frames)
     else:
         res = _from_frames()
@@ -112,8 +112,6 @@ class GPUCurrentLoad(DashboardComponent):
     @without_property_validation
     @log_errors
     def update(self):
-        workers = list(self.scheduler.workers.values())
-
         utilization = []
         memory = []
         gpu_index = []
@@ -122,7 +120,7 @@ class GPUCurrentLoad(DashboardComponent):
         memory_max = 0
         worker = []
 
-        for idx, ws in enumerate(workers):
+        for idx, ws in enumerate(self.scheduler.workers.values()):
             try:
                 mem_used = ws.metrics["gpu_memory_used"]
                 mem_total = ws.metrics["gpu-memory-total"]
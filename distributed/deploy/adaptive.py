@@ -159,7 +159,11 @@ class Adaptive(AdaptiveCore):
                         "Adaptive encountered an error while adapting", exc_info=True
                     )
 
-            self.periodic_callback = PeriodicCallback(_adapt, self.interval * 1000)
+            # Jitter the interval a little, so that many clusters started at the
+            # same time don't all hit their resource managers at the same instants
+            self.periodic_callback = PeriodicCallback(
+                _adapt, self.interval * 1000, jitter=0.1
+            )
             self.state = "starting"
             self.loop.add_callback(self._start)
         else:
@@ -181,6 +185,9 @@ class Adaptive(AdaptiveCore):
         )
 
     def stop(self, reason: str = "unknown") -> None:
+        # Don't let a round queued up by an overlapping adapt call run on a
+        # stopped or closing cluster
+        self._adapt_again = False
         if self.state in ("inactive", "stopped"):
             return
 
@@ -5,10 +5,9 @@ import math
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
 from collections.abc import Iterable
+from itertools import islice
 from typing import TYPE_CHECKING, cast
 
-import tlz as toolz
-
 import dask.config
 
 from distributed.metrics import time
@@ -81,6 +80,7 @@ class AdaptiveCore(ABC):
     close_counts: defaultdict[WorkerState, int]
     log: deque[tuple[float, dict]]
     _adapting: bool
+    _adapt_again: bool
 
     def __init__(
         self,
@@ -98,6 +98,7 @@ class AdaptiveCore(ABC):
         # internal state
         self.close_counts = defaultdict(int)
         self._adapting = False
+        self._adapt_again = False
         self.log = deque(
             maxlen=dask.config.get("distributed.admin.low-level-log-length")
         )
@@ -124,10 +125,13 @@ class AdaptiveCore(ABC):
         Give a list of workers to close that brings us down to target workers
         """
         # TODO, improve me with something that thinks about current load
-        return list(self.observed)[target:]
+        return list(islice(self.observed, target, None))
 
     async def safe_target(self) -> int:
         """Used internally, like target, but respects minimum/maximum"""
+        if self.minimum == self.maximum:
+            # Fixed size; don't bother computing the target
+            return self.minimum
         n = await self.target()
         if n > self.maximum:
             n = cast(int, self.maximum)
@@ -147,37 +151,40 @@ class AdaptiveCore(ABC):
         """
         Make scale up/down recommendations based on current state and target
         """
-        plan = self.plan
-        requested = self.requested
-        observed = self.observed
+        nplan = len(self.plan)
 
-        if target == len(plan):
+        if target == nplan:
             self.close_counts.clear()
             return {"status": "same"}
 
-        if target > len(plan):
+        if target > nplan:
             self.close_counts.clear()
             return {"status": "up", "n": target}
 
-        # target < len(plan)
-        not_yet_arrived = requested - observed
-        to_close = set()
-        if not_yet_arrived:
-            to_close.update(toolz.take(len(plan) - target, not_yet_arrived))
+        # target < nplan
+        to_close: set[WorkerState] = set()
+        requested = self.requested
+        observed = self.observed
+        # Most of the time all requested workers have arrived; checking for that
+        # doesn't build a new set
+        if not requested <= observed:
+            to_close.update(islice(requested - observed, nplan - target))
 
-        if target < len(plan) - len(to_close):
+        if target < nplan - len(to_close):
             L = await self.workers_to_close(target=target)
             to_close.update(L)
 
+        # Only keep counting workers that are still recommended for closing and
+        # haven't reached wait_count yet; this drops everything else at once.
+        close_counts = defaultdict(int)
         firmly_close = set()
         for w in to_close:
-            self.close_counts[w] += 1
-            if self.close_counts[w] >= self.wait_count:
+            count = self.close_counts.get(w, 0) + 1
+            if count >= self.wait_count:
                 firmly_close.add(w)
-
-        for k in list(self.close_counts):  # clear out unseen keys
-            if k in firmly_close or k not in to_close:
-                del self.close_counts[k]
+            else:
+                close_counts[w] = count
+        self.close_counts = close_counts
 
         if firmly_close:
             return {"status": "down", "workers": list(firmly_close)}
@@ -191,23 +198,31 @@ class AdaptiveCore(ABC):
         This is the main event of the system
         """
         if self._adapting:  # Semaphore to avoid overlapping adapt calls
+            # Don't drop the call; make up for it once the current one is done,
+            # as the state it looked at may already be outdated.
+            self._adapt_again = True
             return
         self._adapting = True
-        status = None
 
         try:
-            target = await self.safe_target()
-            recommendations = await self.recommendations(target)
-
-            if recommendations["status"] != "same":
-                self.log.append((time(), dict(recommendations)))
-
-            status = recommendations.pop("status")
-            if status == "same":
-                return
-            if status == "up":
-                await self.scale_up(**recommendations)
-            if status == "down":
-                await self.scale_down(**recommendations)
+            while True:
+                self._adapt_again = False
+                await self._adapt_once()
+                if not self._adapt_again:
+                    break
         finally:
             self._adapting = False
+            self._adapt_again = False
+
+    async def _adapt_once(self) -> None:
+        target = await self.safe_target()
+        recommendations = await self.recommendations(target)
+
+        if recommendations["status"] != "same":
+            self.log.append((time(), dict(recommendations)))
+
+        status = recommendations.pop("status")
+        if status == "up":
+            await self.scale_up(**recommendations)
+        if status == "down":
+            await self.scale_down(**recommendations)
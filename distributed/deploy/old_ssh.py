@@ -6,11 +6,10 @@ import socket
 import sys
 import traceback
 import warnings
-from queue import Queue
+from queue import Empty, Queue
 from threading import Thread
 from time import sleep
 
-from tlz import merge
 from tornado import gen
 
 from distributed.metrics import time
@@ -183,10 +182,14 @@ def async_ssh(cmd_dict):
     transport = ssh.get_transport()
 
     # Wait for a message on the input_queue. Any message received signals this
-    # thread to shut itself down.
-    while cmd_dict["input_queue"].empty():
-        # Kill some time so that this thread does not hog the CPU.
-        sleep(1.0)
+    # thread to shut itself down. Block on the queue rather than sleeping, so that
+    # we react to it right away.
+    while True:
+        try:
+            cmd_dict["input_queue"].get(timeout=1.0)
+            break
+        except Empty:
+            pass
         # Send noise down the pipe to keep connection active
         transport.send_ignore()
         if communicate():
@@ -196,9 +199,10 @@ def async_ssh(cmd_dict):
     start = time()
     while time() < start + 5.0:
         channel.send(b"\x03")  # Ctrl-C
+        # Return as soon as the command exits, but send Ctrl-C again every second
+        channel.status_event.wait(1.0)
         if communicate():
             break
-        sleep(1.0)
 
     # Shutdown the channel, and close the SSH connection
     channel.close()
@@ -244,7 +248,8 @@ def start_scheduler(
     thread.daemon = True
     thread.start()
 
-    return merge(cmd_dict, {"thread": thread})
+    cmd_dict["thread"] = thread
+    return cmd_dict
 
 
 def start_worker(
@@ -330,7 +335,8 @@ def start_worker(
     thread.daemon = True
     thread.start()
 
-    return merge(cmd_dict, {"thread": thread})
+    cmd_dict["thread"] = thread
+    return cmd_dict
 
 
 class SSHCluster:
@@ -461,8 +467,15 @@ class SSHCluster:
         try:
             while True:
                 for process in all_processes:
-                    while not process["output_queue"].empty():
-                        print(process["output_queue"].get())
+                    # Drain everything that's there and print it in one go
+                    lines = []
+                    while True:
+                        try:
+                            lines.append(process["output_queue"].get_nowait())
+                        except Empty:
+                            break
+                    if lines:
+                        print("\n".join(lines))
 
                 # Kill some time and free up CPU before starting the next sweep
                 # through the processes.
@@ -498,8 +511,10 @@ class SSHCluster:
     def shutdown(self):
         all_processes = [self.scheduler] + self.workers
 
+        # Signal all processes first so that they shut down concurrently
         for process in all_processes:
             process["input_queue"].put("shutdown")
+        for process in all_processes:
             process["thread"].join()
 
     def __enter__(self):
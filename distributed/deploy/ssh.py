@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import copy
 import logging
 import sys
 import warnings
 import weakref
+from contextlib import suppress
 from json import dumps
 from typing import Any
 
@@ -15,6 +17,102 @@ from distributed.deploy.spec import ProcessInterface, SpecCluster
 
 logger = logging.getLogger(__name__)
 
+#: sshd's MaxSessions caps the number of sessions per connection, 10 by default.
+#: Every process holds one session, plus at most one transient session while it
+#: starts, so only this many processes share a connection.
+MAX_PROCESSES_PER_CONNECTION = 5
+
+
+class _SharedConnection:
+    """An SSH connection shared by several processes on the same host"""
+
+    def __init__(self, key: tuple, address: str, connect_options: dict):
+        self.key = key
+        self.users = 0
+        self.closed = False
+        self.future = asyncio.ensure_future(self._connect(address, connect_options))
+        self._watcher: asyncio.Task | None = None
+
+    async def _connect(self, address: str, connect_options: dict) -> Any:
+        import asyncssh
+
+        connection = await asyncssh.connect(address, **connect_options)
+        # Stop handing out the connection as soon as it drops
+        self._watcher = watcher = asyncio.ensure_future(connection.wait_closed())
+        watcher.add_done_callback(lambda _: self._evict())
+        return connection
+
+    def _evict(self) -> None:
+        self.closed = True
+        shared = _connections.get(self.key, [])
+        if self in shared:
+            shared.remove(self)
+            if not shared:
+                del _connections[self.key]
+
+    def release(self) -> None:
+        """Release the connection, closing it once no process uses it anymore"""
+        self.users -= 1
+        if self.users:
+            return
+        self._evict()
+        fut = self.future
+        if not fut.done():
+            fut.cancel()
+        elif not fut.cancelled() and fut.exception() is None:
+            with suppress(Exception):
+                fut.result().close()
+
+
+#: Open SSH connections, shared by processes started on the same host with the
+#: same connect options
+_connections: dict[tuple, list[_SharedConnection]] = {}
+
+
+def _connection_key(address: str, connect_options: dict) -> tuple:
+    return (
+        id(asyncio.get_running_loop()),
+        address,
+        dumps(connect_options, sort_keys=True, default=repr),
+    )
+
+
+async def _acquire_connection(
+    address: str, connect_options: dict
+) -> tuple[_SharedConnection, Any]:
+    """Connect to ``address`` with :func:`asyncssh.connect`, or reuse a connection
+    another process opened to it with the same options
+
+    Returns the connection along with the handle to release it with.
+
+    Sessions are multiplexed over shared connections, so starting many processes
+    on the same host only costs one SSH handshake for every
+    ``MAX_PROCESSES_PER_CONNECTION`` of them, and doesn't run into the limit sshd
+    sets on concurrent unauthenticated connections.
+    """
+    try:
+        import asyncssh  # noqa: F401 # import now to fail early
+    except ImportError:
+        raise ImportError(
+            "Dask's SSHCluster requires the `asyncssh` package to be installed. "
+            "Please install it using pip or conda."
+        )
+
+    key = _connection_key(address, connect_options)
+    candidates = _connections.setdefault(key, [])
+    for shared in candidates:
+        if shared.users < MAX_PROCESSES_PER_CONNECTION:
+            break
+    else:
+        shared = _SharedConnection(key, address, connect_options)
+        candidates.append(shared)
+    shared.users += 1
+    try:
+        return shared, await asyncio.shield(shared.future)
+    except BaseException:
+        shared.release()
+        raise
+
 
 class Process(ProcessInterface):
     """A superclass for SSH Workers and Nannies
@@ -27,9 +125,40 @@ class Process(ProcessInterface):
 
     def __init__(self, **kwargs):
         self.connection = None
+        self._shared_connection = None
         self.proc = None
         super().__init__(**kwargs)
 
+    async def _connect(self):
+        # The scheduler replaces self.address with its own once it's up, so hold
+        # on to the handle the connection was acquired with
+        self._shared_connection, self.connection = await _acquire_connection(
+            self.address, self.connect_options
+        )
+
+    async def _read_stderr_until(self, needle: str, count: int = 1) -> str:
+        """Log the remote process' stderr until ``count`` lines containing
+        ``needle`` have come by, and return the last of them
+
+        stderr is read in chunks rather than line by line, which saves an asyncssh
+        round trip for every log line the process prints while starting up.
+        """
+        buf = ""
+        while True:
+            chunk = await self.proc.stderr.read(16384)
+            if not chunk:
+                raise Exception(f"{type(self).__name__} failed to start")
+            buf += chunk
+            *lines, buf = buf.split("\n")
+            for line in lines:
+                line = line.strip()
+                if line:
+                    logger.info(line)
+                if needle in line:
+                    count -= 1
+                    if not count:
+                        return line
+
     async def start(self):
         assert self.connection
         weakref.finalize(
@@ -38,11 +167,21 @@ class Process(ProcessInterface):
         await super().start()
 
     async def close(self):
-        if self.proc:
-            self.proc.kill()  # https://github.com/ronf/asyncssh/issues/112
-        if self.connection:
-            self.connection.close()
-        await super().close()
+        try:
+            if self.proc:
+                # The channel may already be gone, e.g. if the connection dropped
+                with suppress(Exception):
+                    self.proc.kill()  # https://github.com/ronf/asyncssh/issues/112
+                # The connection may be shared with other processes and stay
+                # open, so close our own channel to end the remote process
+                with suppress(Exception):
+                    self.proc.close()
+                    await self.proc.wait_closed()
+            if self.connection:
+                self.connection = None
+                self._shared_connection.release()
+        finally:
+            await super().close()
 
 
 class Worker(Process):
@@ -125,15 +264,7 @@ class Worker(Process):
         self.n_workers = value
 
     async def start(self):
-        try:
-            import asyncssh  # import now to avoid adding to module startup time
-        except ImportError:
-            raise ImportError(
-                "Dask's SSHCluster requires the `asyncssh` package to be installed. "
-                "Please install it using pip or conda."
-            )
-
-        self.connection = await asyncssh.connect(self.address, **self.connect_options)
+        await self._connect()
 
         result = await self.connection.run("uname")
         if result.exit_status == 0:
@@ -180,14 +311,7 @@ class Worker(Process):
         self.proc = await self.connection.create_process(cmd)
 
         # We watch stderr in order to get the address, then we return
-        started_workers = 0
-        while started_workers < self.n_workers:
-            line = await self.proc.stderr.readline()
-            if not line.strip():
-                raise Exception("Worker failed to start")
-            logger.info(line.strip())
-            if "worker at" in line:
-                started_workers += 1
+        line = await self._read_stderr_until("worker at", count=self.n_workers)
         logger.debug("%s", line)
         await super().start()
 
@@ -223,17 +347,9 @@ class Scheduler(Process):
         self.remote_python = remote_python or sys.executable
 
     async def start(self):
-        try:
-            import asyncssh  # import now to avoid adding to module startup time
-        except ImportError:
-            raise ImportError(
-                "Dask's SSHCluster requires the `asyncssh` package to be installed. "
-                "Please install it using pip or conda."
-            )
-
         logger.debug("Created Scheduler Connection")
 
-        self.connection = await asyncssh.connect(self.address, **self.connect_options)
+        await self._connect()
 
         result = await self.connection.run("uname")
         if result.exit_status == 0:
@@ -264,14 +380,8 @@ class Scheduler(Process):
         self.proc = await self.connection.create_process(cmd)
 
         # We watch stderr in order to get the address, then we return
-        while True:
-            line = await self.proc.stderr.readline()
-            if not line.strip():
-                raise Exception("Worker failed to start")
-            logger.info(line.strip())
-            if "Scheduler at" in line:
-                self.address = line.split("Scheduler at:")[1].strip()
-                break
+        line = await self._read_stderr_until("Scheduler at")
+        self.address = line.split("Scheduler at:")[1].strip()
         logger.debug("%s", line)
         await super().start()
 
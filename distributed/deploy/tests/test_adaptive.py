@@ -444,7 +444,9 @@ async def test_adapt_gets_stopped_on_cluster_close():
         pass
 
     async with MyCluster(asynchronous=True) as cluster:
-        adapt = cluster.adapt(minimum=1, maximum=10, interval="10ms")
+        # Use a long interval, so that no tick can stop adapt before the
+        # cluster is closed
+        adapt = cluster.adapt(minimum=1, maximum=10, interval="1 hour")
         while adapt.state != "running":
             await asyncio.sleep(0.01)
         await cluster.close()
@@ -691,6 +693,38 @@ async def test_adapt_callback_logs_error_in_scale_down():
         assert adapt.periodic_callback.is_running()
 
 
+@gen_test()
+async def test_adapt_stop_drops_queued_round():
+    class SlowAdaptive(MyAdaptive):
+        async def scale_up(self, n=0):
+            self.scaled.append(n)
+            await self.event.wait()
+            await super().scale_up(n)
+
+    async with LocalCluster(
+        n_workers=0,
+        asynchronous=True,
+        dashboard_address=":0",
+    ) as cluster:
+        adapt = cluster.adapt(Adaptive=SlowAdaptive, interval="1 hour")
+        adapt.scaled = []
+        adapt.event = asyncio.Event()
+        adapt._target = 2
+        task = asyncio.create_task(adapt.adapt())
+        while not adapt.scaled:
+            await asyncio.sleep(0.01)
+
+        # Queue up another round while the first one is still scaling up
+        adapt._target = 3
+        await adapt.adapt()
+        adapt.stop()
+
+        adapt.event.set()
+        await task
+        assert adapt.scaled == [2]
+        assert not adapt._adapting
+
+
 @pytest.mark.parametrize("wait_until_running", [True, False])
 @gen_test()
 async def test_adaptive_logs_stopping_once(wait_until_running):
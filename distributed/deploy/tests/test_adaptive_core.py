@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from distributed.deploy.adaptive_core import AdaptiveCore
 from distributed.utils_test import gen_test
 
@@ -45,6 +47,16 @@ async def test_safe_target():
     assert await adapt.safe_target() == 4
 
 
+@gen_test()
+async def test_safe_target_fixed_size():
+    class NoTarget(MyAdaptiveCore):
+        async def target(self):
+            raise AssertionError("target() shouldn't be called")
+
+    adapt = NoTarget(minimum=2, maximum=2)
+    assert await adapt.safe_target() == 2
+
+
 @gen_test()
 async def test_scale_up():
     adapt = MyAdaptiveCore(minimum=1, maximum=4)
@@ -82,3 +94,31 @@ async def test_scale_down():
     await adapt.adapt()
     await adapt.adapt()
     assert list(adapt.log) == old
+
+
+@gen_test()
+async def test_overlapping_adapt_calls_are_coalesced():
+    class SlowTarget(MyAdaptiveCore):
+        async def target(self):
+            self.calls += 1
+            await self.event.wait()
+            return self._target
+
+    adapt = SlowTarget(minimum=0, maximum=4)
+    adapt.calls = 0
+    adapt.event = asyncio.Event()
+    task = asyncio.create_task(adapt.adapt())
+    while not adapt.calls:
+        await asyncio.sleep(0)
+
+    # These return immediately, but the target is computed once more afterwards
+    adapt._target = 3
+    await adapt.adapt()
+    await adapt.adapt()
+    assert adapt.calls == 1
+
+    adapt.event.set()
+    await task
+    assert adapt.calls == 2
+    assert adapt.plan == {0, 1, 2}
+    assert not adapt._adapting
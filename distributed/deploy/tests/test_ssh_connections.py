@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from distributed.deploy import ssh
+from distributed.utils_test import gen_test
+
+
+class FakeConnection:
+    def __init__(self, address):
+        self.address = address
+        self._closed = asyncio.Event()
+
+    def close(self):
+        self._closed.set()
+
+    async def wait_closed(self):
+        await self._closed.wait()
+
+
+@pytest.fixture
+def fake_asyncssh(monkeypatch):
+    """Stand-in for asyncssh that records the connections it makes"""
+    connections = []
+
+    async def connect(address, **kwargs):
+        await asyncio.sleep(0)
+        conn = FakeConnection(address)
+        connections.append(conn)
+        return conn
+
+    monkeypatch.setitem(sys.modules, "asyncssh", types.SimpleNamespace(connect=connect))
+    monkeypatch.setattr(ssh, "_connections", {})
+    return connections
+
+
+@gen_test()
+async def test_connections_are_shared_up_to_session_cap(fake_asyncssh):
+    n = ssh.MAX_PROCESSES_PER_CONNECTION
+    acquired = await asyncio.gather(
+        *(ssh._acquire_connection("host", {}) for _ in range(n + 1))
+    )
+    assert len(fake_asyncssh) == 2
+    assert {conn for _, conn in acquired[:n]} == {fake_asyncssh[0]}
+    assert acquired[n][1] is fake_asyncssh[1]
+
+    # Different hosts or options don't share
+    _, other = await ssh._acquire_connection("other", {})
+    _, options = await ssh._acquire_connection("host", {"port": 23})
+    assert len({other, options, *fake_asyncssh[:2]}) == 4
+
+    for shared, _ in acquired[:-1]:
+        shared.release()
+    assert fake_asyncssh[0]._closed.is_set()
+    assert not fake_asyncssh[1]._closed.is_set()
+    acquired[-1][0].release()
+    assert fake_asyncssh[1]._closed.is_set()
+
+
+@gen_test()
+async def test_dropped_connection_is_not_reused(fake_asyncssh):
+    shared, conn = await ssh._acquire_connection("host", {})
+    conn.close()  # e.g. the remote end went away
+    while ssh._connections:
+        await asyncio.sleep(0.01)
+
+    shared2, conn2 = await ssh._acquire_connection("host", {})
+    assert conn2 is not conn
+    shared.release()
+    assert not conn2._closed.is_set()
+    shared2.release()
+    assert conn2._closed.is_set()
+    assert not ssh._connections
+
+
+@gen_test()
+async def test_failed_connection_is_released(fake_asyncssh, monkeypatch):
+    async def connect(address, **kwargs):
+        raise OSError("no route to host")
+
+    monkeypatch.setattr(sys.modules["asyncssh"], "connect", connect)
+    with pytest.raises(OSError, match="no route"):
+        await ssh._acquire_connection("host", {})
+    assert not ssh._connections
+
+
+class FakeProcess:
+    def __init__(self):
+        self.killed = False
+        self.closed = False
+
+    def kill(self):
+        self.killed = True
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+@gen_test()
+async def test_closing_process_closes_its_channel(fake_asyncssh):
+    processes = []
+    for _ in range(2):
+        process = ssh.Process()
+        process.address = "host"
+        process.connect_options = {}
+        await process._connect()
+        process.proc = FakeProcess()
+        processes.append(process)
+    first, second = processes
+    assert first.connection is second.connection
+
+    await first.close()
+    assert first.proc.killed
+    assert first.proc.closed
+    assert not second.proc.closed
+    # Still in use by the other process
+    assert not fake_asyncssh[0]._closed.is_set()
+
+    await second.close()
+    assert second.proc.closed
+    assert fake_asyncssh[0]._closed.is_set()
@@ -7,8 +7,6 @@ from collections import defaultdict
 from timeit import default_timer
 from typing import ClassVar
 
-from tlz import groupby, valmap
-
 from dask.tokenize import tokenize
 from dask.utils import key_split
 
@@ -28,8 +26,13 @@ def dependent_keys(tasks, complete=False):
     out = set()
     errors = set()
     stack = list(tasks)
+    # This walks the whole graph behind the keys, so avoid attribute lookups
+    # in the loop
+    pop = stack.pop
+    extend = stack.extend
+    add = out.add
     while stack:
-        ts = stack.pop()
+        ts = pop()
         key = ts.key
         if key in out:
             continue
@@ -40,11 +43,27 @@ def dependent_keys(tasks, complete=False):
             if not complete:
                 continue
 
-        out.add(key)
-        stack.extend(ts.dependencies)
+        add(key)
+        extend(ts.dependencies)
     return out, errors
 
 
+async def _wait_for_tasks(scheduler, keys):
+    """Wait until the scheduler has a task for each of *keys*
+
+    Only the keys that were still missing at the previous check are looked up
+    again, rather than all of them every time.
+    """
+    missing = [k for k in keys if k not in scheduler.tasks]
+    while missing:
+        await asyncio.sleep(0.05)
+        tasks = scheduler.tasks
+        missing = [k for k in missing if k not in tasks]
+        if not missing:
+            # Keys found earlier may have been forgotten since
+            missing = [k for k in keys if k not in tasks]
+
+
 class Progress(SchedulerPlugin):
     """Tracks progress of a set of keys or futures
 
@@ -67,8 +86,7 @@ class Progress(SchedulerPlugin):
 
     def __init__(self, keys, scheduler, minimum=0, dt=0.1, complete=False, name=None):
         self.name = name or f"progress-{tokenize(keys, minimum, dt, complete)}"
-        self.keys = {k.key if hasattr(k, "key") else k for k in keys}
-        self.keys = {k for k in self.keys}
+        self.keys = {getattr(k, "key", k) for k in keys}
         self.scheduler = scheduler
         self.complete = complete
         self._minimum = minimum
@@ -82,8 +100,7 @@ class Progress(SchedulerPlugin):
     async def setup(self):
         keys = self.keys
 
-        while not keys.issubset(self.scheduler.tasks):
-            await asyncio.sleep(0.05)
+        await _wait_for_tasks(self.scheduler, keys)
 
         tasks = [self.scheduler.tasks[k] for k in keys]
 
@@ -191,6 +208,7 @@ class MultiProgress(Progress):
             group_by = func
         self.group_by = key_split if group_by in (None, "prefix") else group_by
         self.func = None
+        self._groups = {}
         name = f"multi-progress-{tokenize(keys, group_by, minimum, dt, complete)}"
         super().__init__(
             keys, scheduler, minimum=minimum, dt=dt, complete=complete, name=name
@@ -199,8 +217,7 @@ class MultiProgress(Progress):
     async def setup(self):
         keys = self.keys
 
-        while not keys.issubset(self.scheduler.tasks):
-            await asyncio.sleep(0.05)
+        await _wait_for_tasks(self.scheduler, keys)
 
         tasks = [self.scheduler.tasks[k] for k in keys]
 
@@ -234,12 +251,19 @@ class MultiProgress(Progress):
         else:
             self.func = self.group_by
 
-        # Group keys by func name
-        self.keys = valmap(set, groupby(self.func, self.keys))
-        self.all_keys = valmap(set, groupby(self.func, self.all_keys))
-        for k in self.all_keys:
-            if k not in self.keys:
-                self.keys[k] = set()
+        # Group keys by func name. Transitions of keys that we don't track are by
+        # far the most common ones; self._groups lets us discard them with a
+        # single lookup, without calling func.
+        func = self.func
+        self._groups = groups = {k: func(k) for k in self.all_keys}
+        all_keys = defaultdict(set)
+        for k, group in groups.items():
+            all_keys[group].add(k)
+        self.all_keys = dict(all_keys)
+        keys = {group: set() for group in self.all_keys}
+        for k in self.keys:
+            keys[groups[k]].add(k)
+        self.keys = keys
 
         for k in errors:
             self.transition(
@@ -248,25 +272,26 @@ class MultiProgress(Progress):
         logger.debug("Set up Progress keys")
 
     def transition(self, key, start, finish, *args, **kwargs):
+        # None is a valid group, so test for membership
+        if key not in self._groups:
+            return
+        group = self._groups[key]
+
         if start == "processing" and finish == "memory":
-            s = self.keys.get(self.func(key), None)
-            if s and key in s:
+            s = self.keys[group]
+            if key in s:
                 s.remove(key)
 
-            if not self.keys or not any(self.keys.values()):
+            if not any(self.keys.values()):
                 self.stop()
 
         if finish == "erred":
             logger.debug("Progress sees task erred")
-            k = self.func(key)
-            if k in self.all_keys and key in self.all_keys[k]:
-                self.stop(exception=kwargs.get("exception"), key=key)
+            self.stop(exception=kwargs.get("exception"), key=key)
 
         if finish == "forgotten":
-            k = self.func(key)
-            if k in self.all_keys and key in self.all_keys[k]:
-                logger.debug("A task was cancelled (%s), stopping progress", key)
-                self.stop(exception=True)
+            logger.debug("A task was cancelled (%s), stopping progress", key)
+            self.stop(exception=True)
 
 
 def format_time(t):
@@ -300,13 +325,18 @@ class AllProgress(SchedulerPlugin):
         self.state = defaultdict(lambda: defaultdict(set))
         self.scheduler = scheduler
 
+        # Use locals in the loop; this runs over every task on the scheduler
+        all_ = self.all
+        nbytes = self.nbytes
+        state = self.state
         for ts in self.scheduler.tasks.values():
             key = ts.key
             prefix = ts.prefix.name
-            self.all[prefix].add(key)
-            self.state[ts.state][prefix].add(key)
-            if ts.nbytes >= 0:
-                self.nbytes[prefix] += ts.nbytes
+            all_[prefix].add(key)
+            state[ts.state][prefix].add(key)
+            nb = ts.nbytes
+            if nb >= 0:
+                nbytes[prefix] += nb
 
         scheduler.add_plugin(self)
 
@@ -384,38 +414,37 @@ class GroupTiming(SchedulerPlugin):
                 return
 
             # Possibly extend the timeseries if another dt has passed
+            times = self.time
             now = time()
-            self.time[-1] = now
-            while self.time[-1] - self.time[-2] > self.dt:
-                self.time[-1] = self.time[-2] + self.dt
-                self.time.append(now)
+            times[-1] = now
+            while times[-1] - times[-2] > self.dt:
+                times[-1] = times[-2] + self.dt
+                times.append(now)
                 self.nthreads.append(self.scheduler.total_nthreads)
                 for g in self.compute.values():
                     g.append(0.0)
 
-            # Get the task
-            task = self.scheduler.tasks[key]
-            group = task.group
-
-            # If the group is new, add it to the timeseries as if it has been
-            # here the whole time
-            if group.name not in self.compute:
-                self.compute[group.name] = [0.0] * len(self.time)
+            # Get the task's group. If the group is new, add it to the timeseries
+            # as if it has been here the whole time
+            name = self.scheduler.tasks[key].group.name
+            compute = self.compute.get(name)
+            if compute is None:
+                compute = self.compute[name] = [0.0] * len(times)
 
             for startstop in startstops:
                 if startstop["action"] != "compute":
                     continue
                 stop = startstop["stop"]
                 start = startstop["start"]
-                idx = len(self.time) - 1
+                idx = len(times) - 1
                 # If the stop time is after the most recent bin,
                 # roll back the current index. Not clear how often this happens.
-                while idx > 0 and self.time[idx - 1] > stop:
+                while idx > 0 and times[idx - 1] > stop:
                     idx -= 1
                 # Allocate the timing information of the task to the time bins.
                 while idx > 0 and stop > start:
-                    delta = stop - max(self.time[idx - 1], start)
-                    self.compute[group.name][idx] += delta
+                    delta = stop - max(times[idx - 1], start)
+                    compute[idx] += delta
 
                     stop -= delta
                     idx -= 1
@@ -4,6 +4,8 @@ import asyncio
 
 import pytest
 
+from dask.utils import key_split
+
 import distributed
 from distributed import Nanny
 from distributed.client import wait
@@ -55,6 +57,37 @@ async def test_many_Progress(c, s, a, b):
         await asyncio.sleep(0.01)
 
 
+@gen_cluster(client=True)
+async def test_Progress_waits_for_tasks(c, s, a, b):
+    ev = distributed.Event()
+    p = Progress(keys=["x"], scheduler=s)
+    setup = asyncio.create_task(p.setup())
+    await asyncio.sleep(0.01)
+    assert not setup.done()
+
+    x = c.submit(lambda ev: ev.wait(), ev, key="x")
+    await asyncio.wait_for(setup, 0.5)
+    assert p.keys == {"x"}
+
+    await ev.set()
+    await x
+    while p.status != "finished":
+        await asyncio.sleep(0.01)
+
+
+@gen_cluster(client=True)
+async def test_Progress_waits_for_scattered_data(c, s, a, b):
+    p = Progress(keys=["x"], scheduler=s)
+    setup = asyncio.create_task(p.setup())
+    await asyncio.sleep(0.01)
+    assert not setup.done()
+
+    x = await c.scatter({"x": 1})
+    await asyncio.wait_for(setup, 0.5)
+    assert p.status == "finished"
+    del x
+
+
 @gen_cluster(client=True)
 async def test_multiprogress(c, s, a, b):
     x1 = c.submit(f, 1)
@@ -119,6 +152,42 @@ async def test_multiprogress_with_prefix(c, s, a, b):
     assert group_names == {"inc"}
 
 
+@gen_cluster(client=True)
+async def test_multiprogress_group_none(c, s, a, b):
+    x = c.submit(inc, 1)
+    y = c.submit(inc, x)
+    p = MultiProgress([y], scheduler=s, complete=True, group_by=lambda key: None)
+    await p.setup()
+    assert p.all_keys == {None: {x.key, y.key}}
+
+    await y
+    assert p.keys == {None: set()}
+    assert p.status == "finished"
+
+
+@gen_cluster(client=True)
+async def test_multiprogress_ignores_untracked_keys(c, s, a, b):
+    calls = []
+
+    def group_by(key):
+        calls.append(key)
+        return key_split(key)
+
+    ev = distributed.Event()
+    x = c.submit(lambda ev: ev.wait(), ev, key="wait")
+    p = MultiProgress([x], scheduler=s, complete=True, group_by=group_by)
+    await p.setup()
+    del calls[:]
+
+    y = c.submit(inc, 2)
+    await y
+    assert not calls
+
+    await ev.set()
+    await x
+    assert p.status == "finished"
+
+
 def test_multiprogress_warns():
     with pytest.warns(DeprecationWarning, match="func` is deprecated, use `group_by"):
         p = MultiProgress([], complete=True, func="spans")
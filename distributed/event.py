@@ -3,8 +3,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
-from collections import defaultdict
-from contextlib import suppress
 
 from dask.utils import parse_timedelta
 
@@ -33,7 +31,7 @@ class EventExtension:
     However, this would cause a memory leak: created events in the
     dictionary are never removed.
     For this, we also keep a counter for the number of waiters on
-    a specific event.
+    a specific event, next to the event itself.
     If an event is set, we need to keep track of this state so
     we can not remove it (the default flag is false).
     If it is unset but there are waiters, we can also not remove
@@ -44,11 +42,10 @@ class EventExtension:
 
     def __init__(self, scheduler):
         self.scheduler = scheduler
-        # Keep track of all current events, identified by their name
-        self._events = defaultdict(asyncio.Event)
-        # Keep track on how many waiters are present, so we know when
-        # we can remove the event
-        self._waiter_count = defaultdict(int)
+        # Keep track of all current events, identified by their name, along
+        # with how many waiters are present, so we know when we can remove
+        # the event: {name: [event, waiter count]}
+        self._events = {}
 
         self.scheduler.handlers.update(
             {
@@ -67,24 +64,25 @@ class EventExtension:
         """
         name = self._normalize_name(name)
 
-        event = self._events[name]
+        entry = self._get_event(name)
+        event = entry[0]
         future = event.wait()
         if timeout is not None:
             future = wait_for(future, timeout)
 
-        self._waiter_count[name] += 1
+        entry[1] += 1
         try:
             await future
         except TimeoutError:
             return False
         finally:
-            self._waiter_count[name] -= 1
+            entry[1] -= 1
 
-            if not self._waiter_count[name] and not event.is_set():
+            if not entry[1] and not event.is_set():
                 # No one is waiting for this
                 # and as the default flag for an event is false
                 # we can safely remove it
-                self._delete_event(name)
+                self._delete_event(name, entry)
 
         return True
 
@@ -97,17 +95,20 @@ class EventExtension:
         name = self._normalize_name(name)
         # No matter if someone is listening or not,
         # we set the event to true
-        self._events[name].set()
+        self._get_event(name)[0].set()
 
     @log_errors
     def event_clear(self, name=None):
         """Set the event with the given name to false."""
         name = self._normalize_name(name)
-        if not self._waiter_count[name]:
+        entry = self._events.get(name)
+        if entry is None:
+            return
+        if not entry[1]:
             # No one is waiting for this
             # and as the default flag for an event is false
             # we can safely remove it
-            self._delete_event(name)
+            self._delete_event(name, entry)
 
         else:
             # There are waiters
@@ -116,21 +117,19 @@ class EventExtension:
             # (because if it is set, all waiters should have been
             # notified). But to prevent race conditions
             # due to unlucky timing, we clear anyways
-            assert name in self._events
-            event = self._events[name]
-            event.clear()
+            entry[0].clear()
 
     @log_errors
     def event_is_set(self, name=None):
         name = self._normalize_name(name)
         # the default flag value is false
-        # we could also let the defaultdict
-        # create a new event for us, but that
-        # could produce many unused events
-        if name not in self._events:
+        # we could also create a new event here,
+        # but that could produce many unused events
+        entry = self._events.get(name)
+        if entry is None:
             return False
 
-        return self._events[name].is_set()
+        return entry[0].is_set()
 
     def _normalize_name(self, name):
         """Helper function to normalize an event name"""
@@ -139,13 +138,19 @@ class EventExtension:
 
         return name
 
-    def _delete_event(self, name):
+    def _get_event(self, name):
+        """Helper function to get the ``[event, waiter count]`` entry for an
+        event, creating it if needed"""
+        entry = self._events.get(name)
+        if entry is None:
+            entry = self._events[name] = [asyncio.Event(), 0]
+        return entry
+
+    def _delete_event(self, name, entry):
         """Helper function to delete an event"""
-        # suppress key errors to make calling this method
-        # also possible if we do not even have such an event
-        with suppress(KeyError):
-            del self._waiter_count[name]
-        with suppress(KeyError):
+        # Only delete the entry we were handed; the name may have been
+        # removed and created anew in the meantime
+        if self._events.get(name) is entry:
             del self._events[name]
 
 
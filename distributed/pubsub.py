@@ -102,19 +102,20 @@ class PubSubSchedulerExtension:
             del self.publishers[name]
 
     def handle_message(self, name=None, msg=None, worker=None, client=None):
-        for c in list(self.client_subscribers[name]):
+        # The same message is broadcast to every subscriber
+        data = {"op": "pubsub-msg", "name": name, "msg": msg}
+        to_drop = []
+        for c in self.client_subscribers[name]:
             try:
-                self.scheduler.client_comms[c].send(
-                    {"op": "pubsub-msg", "name": name, "msg": msg}
-                )
+                self.scheduler.client_comms[c].send(data)
             except (KeyError, CommClosedError):
-                self.remove_subscriber(name=name, client=c)
+                to_drop.append(c)
+        for c in to_drop:
+            self.remove_subscriber(name=name, client=c)
 
         if client:
             for sub in self.subscribers[name]:
-                self.scheduler.worker_send(
-                    sub, {"op": "pubsub-msg", "name": name, "msg": msg}
-                )
+                self.scheduler.worker_send(sub, data)
 
 
 class PubSubWorkerExtension:
@@ -307,10 +308,13 @@ class Pub:
         self._started = False
         self._buffer = []
 
+        if self.worker:
+            self._pubsub = self.worker.extensions["pubsub"]
+
         self.loop.add_callback(self._start)
 
         if self.worker:
-            pubsub = self.worker.extensions["pubsub"]
+            pubsub = self._pubsub
             self.loop.add_callback(pubsub.publishers[name].add, self)
             weakref.finalize(self, pubsub.trigger_cleanup)
 
@@ -319,9 +323,8 @@ class Pub:
             result = await self.scheduler.pubsub_add_publisher(
                 name=self.name, worker=self.worker.address
             )
-            pubsub = self.worker.extensions["pubsub"]
             self.subscribers.update(result["subscribers"])
-            pubsub.publish_to_scheduler[self.name] = result["publish-scheduler"]
+            self._pubsub.publish_to_scheduler[self.name] = result["publish-scheduler"]
 
         self._started = True
 
@@ -337,10 +340,11 @@ class Pub:
         data = {"op": "pubsub-msg", "name": self.name, "msg": to_serialize(msg)}
 
         if self.worker:
+            send_to_worker = self.worker.send_to_worker
             for sub in self.subscribers:
-                self.worker.send_to_worker(sub, data)
+                send_to_worker(sub, data)
 
-            if self.worker.extensions["pubsub"].publish_to_scheduler[self.name]:
+            if self._pubsub.publish_to_scheduler[self.name]:
                 self.worker.batched_stream.send(data)
         elif self.client:
             self.client.scheduler_comm.send(data)
@@ -381,6 +385,8 @@ class Sub:
             self.loop = self.client.loop
         self.name = name
         self.buffer = deque()
+        # Set whenever a message is appended to the buffer
+        self._received = asyncio.Event()
 
         if self.worker:
             pubsub = self.worker.extensions["pubsub"]
@@ -398,14 +404,6 @@ class Sub:
 
         weakref.finalize(self, pubsub.trigger_cleanup)
 
-    @property
-    def condition(self):
-        try:
-            return self._condition
-        except AttributeError:
-            self._condition = asyncio.Condition()
-            return self._condition
-
     async def _get(self, timeout=None):
         start = time()
         while not self.buffer:
@@ -416,14 +414,8 @@ class Sub:
             else:
                 timeout2 = None
 
-            async def _():
-                await self.condition.acquire()
-                await self.condition.wait()
-
-            try:
-                await wait_for(_(), timeout2)
-            finally:
-                self.condition.release()
+            self._received.clear()
+            await wait_for(self._received.wait(), timeout2)
 
         return self.buffer.popleft()
 
@@ -459,8 +451,7 @@ class Sub:
 
     async def _put(self, msg):
         self.buffer.append(msg)
-        async with self.condition:
-            self.condition.notify()
+        self._received.set()
 
     def __repr__(self):
         return f"<Sub: {self.name}>"
@@ -74,7 +74,7 @@ from dask.widgets import get_template
 from distributed import cluster_dump, preloading, profile
 from distributed import versions as version_module
 from distributed._asyncio import RLock
-from distributed._stories import scheduler_story
+from distributed._stories import TransitionLog, scheduler_story
 from distributed.active_memory_manager import ActiveMemoryManagerExtension, RetireWorker
 from distributed.batched import BatchedSend
 from distributed.broker import Broker
@@ -1698,7 +1698,7 @@ class SchedulerState:
     #: History of task state transitions.
     #: The length can be tweaked through
     #: distributed.admin.low-level-log-length
-    transition_log: deque[Transition]
+    transition_log: TransitionLog
 
     #: Total number of transitions since the cluster was started
     transition_counter: int
@@ -1788,7 +1788,7 @@ class SchedulerState:
         }
         self.plugins = {} if not plugins else {_get_plugin_name(p): p for p in plugins}
 
-        self.transition_log = deque(
+        self.transition_log = TransitionLog(
             maxlen=dask.config.get("distributed.admin.low-level-log-length")
         )
         self.transition_counter = 0
@@ -2042,6 +2042,9 @@ class SchedulerState:
                 stimulus_id = STIMULUS_ID_UNSET
 
             actual_finish = ts._state
+            # No need to sys.intern the strings of the log entry: task states are
+            # literals, which CPython interns already, and every transition caused
+            # by the same stimulus shares the same stimulus_id object.
             self.transition_log.append(
                 Transition(
                     key, start, actual_finish, recommendations, stimulus_id, time()
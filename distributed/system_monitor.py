@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 from collections import deque
+from itertools import islice
 from typing import Any
 
 import psutil
@@ -229,12 +230,18 @@ class SystemMonitor:
         if start >= self.count:
             return {k: [] for k in self.quantities}
 
-        istart = min(-1, max(-len(self.quantities["cpu"]), start - self.count))
+        n = max(1, min(len(self.quantities["cpu"]), self.count - start))
 
-        return {
-            k: [v[i] if -i <= len(v) else None for i in range(istart, 0)]
-            for k, v in self.quantities.items()
-        }
+        # Slice each deque in one go rather than indexing it element by element.
+        # Quantities with a shorter history are padded on the left with None.
+        result: dict[str, list[float | None]] = {}
+        for k, v in self.quantities.items():
+            missing = n - len(v)
+            if missing > 0:
+                result[k] = [None] * missing + list(v)
+            else:
+                result[k] = list(islice(v, -missing, None))
+        return result
 
     def close(self) -> None:
         if self.monitor_gil_contention:
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import gc
 import operator
 import sys
+import weakref
 from time import sleep
 
+import cloudpickle
 import pytest
 
 import dask
@@ -20,6 +23,7 @@ from distributed import (
     wait,
     worker_client,
 )
+from distributed.actor import _actor_method
 from distributed.metrics import time
 from distributed.utils import LateLoopEvent
 from distributed.utils_test import cluster, double, gen_cluster, inc
@@ -95,6 +99,47 @@ async def test_client_actions(s, a, b, direct_to_workers):
             await asyncio.sleep(0.01)
 
 
+@gen_cluster(client=True)
+async def test_method_dispatcher_is_cached(c, s, a, b):
+    counter = await c.submit(Counter, actor=True)
+    other = await c.submit(Counter, actor=True)
+
+    assert counter.increment.__func__ is other.increment.__func__
+    assert counter.increment.__func__ is not counter.add.__func__
+    assert counter.increment.__name__ == "increment"
+    assert counter.add.__wrapped__ is Counter.add
+
+    assert await counter.increment() == 1
+    assert await other.add(10) == 10
+    assert await counter.n == 1
+
+    # Actor only has slots; attributes can't be set on it by accident
+    with pytest.raises(AttributeError):
+        counter.n = 2
+    # ... but it can still be weakly referenced
+    assert weakref.ref(counter)() is counter
+
+
+def test_method_dispatcher_cache_does_not_leak_classes():
+    class Base:
+        def f(self):
+            return 1
+
+    class Dynamic(Base):
+        def f(self):
+            return super().f() + 1
+
+    dispatcher = _actor_method(Dynamic, "f", Dynamic.f)
+    assert _actor_method(Dynamic, "f", Dynamic.f) is dispatcher
+    # Pickling a class by value doesn't drag the cache along
+    assert cloudpickle.loads(cloudpickle.dumps(Dynamic))._dask_actor_methods == {}
+
+    ref = weakref.ref(Dynamic)
+    del Dynamic, dispatcher
+    gc.collect()
+    assert ref() is None
+
+
 @pytest.mark.parametrize("separate_thread", [False, True])
 @gen_cluster(client=True)
 async def test_worker_actions(c, s, a, b, separate_thread):
@@ -6,6 +6,8 @@ import random
 import pytest
 from tlz import assoc
 
+import dask
+
 from distributed.batched import BatchedSend
 from distributed.core import CommClosedError, connect, listen
 from distributed.metrics import time
@@ -254,3 +256,25 @@ async def test_serializers():
         assert "function" in value
 
         assert comm.closed()
+
+
+@gen_test()
+async def test_high_water_flushes_early():
+    async with EchoServer() as e:
+        comm = await connect(e.address)
+
+        with dask.config.set({"distributed.comm.batch-high-water": 3}):
+            b = BatchedSend(interval="1h")
+        b.start(comm)
+
+        b.send("first")
+        assert await comm.read() == ("first",)
+
+        # The interval hasn't expired yet, but the buffer hit the high-water mark
+        b.send("a", "b")
+        await asyncio.sleep(0.020)
+        assert b.buffer == ["a", "b"]
+        b.send("c")
+        assert await wait_for(comm.read(), 5) == ("a", "b", "c")
+
+        await comm.close()
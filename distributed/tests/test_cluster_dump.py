@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import io
 from pathlib import Path
 
 import fsspec
@@ -9,7 +10,12 @@ import pytest
 import yaml
 
 import distributed
-from distributed.cluster_dump import DumpArtefact, _tuple_to_list, write_state
+from distributed.cluster_dump import (
+    DumpArtefact,
+    _tuple_to_list,
+    _write_msgpack,
+    write_state,
+)
 from distributed.utils_test import assert_story, gen_cluster, gen_test, inc
 
 
@@ -20,6 +26,7 @@ from distributed.utils_test import assert_story, gen_cluster, gen_test, inc
         ((1, 2, 3), [1, 2, 3]),
         ({"x": (1, (2,))}, {"x": [1, [2]]}),
         ("foo", "foo"),
+        ({1: (2**70, None)}, {1: [2**70, None]}),
     ],
 )
 def test_tuple_to_list(input, expected):
@@ -40,6 +47,26 @@ async def test_write_state_msgpack(tmp_path):
         assert readback == _tuple_to_list(await get_state())
 
 
+@gen_test()
+async def test_write_state_msgpack_zstd(tmp_path):
+    pytest.importorskip("zstandard")
+    path = str(tmp_path / "bar.msgpack.zst")
+    await write_state(get_state, path, "msgpack")
+
+    with fsspec.open(path, "rb", compression="zstd") as f:
+        readback = msgpack.load(f)
+        assert readback == _tuple_to_list(await get_state())
+    assert DumpArtefact.from_url(path).dump == readback
+
+
+@pytest.mark.parametrize("depth", [0, 1, 2, 3])
+def test_write_msgpack_streamed(depth):
+    state = {"a": {"b": {"c": (1, 2)}, "d": []}, "e": 1, "f": {}}
+    f = io.BytesIO()
+    _write_msgpack(state, f, depth=depth)
+    assert f.getvalue() == msgpack.packb(state)
+
+
 @gen_test()
 async def test_write_state_yaml(tmp_path):
     path = str(tmp_path / "bar")
@@ -51,7 +51,6 @@ async def test_event_on_workers(c, s, a, b):
     await c.gather(wait_futures)
 
     assert not s.extensions["events"]._events
-    assert not s.extensions["events"]._waiter_count
 
 
 @gen_cluster(client=True)
@@ -64,7 +63,6 @@ async def test_default_event(c, s, a, b):
 
     # Cleanup should have happened
     assert not s.extensions["events"]._events
-    assert not s.extensions["events"]._waiter_count
 
 
 @gen_cluster(client=True)
@@ -87,7 +85,6 @@ async def test_set_not_set(c, s, a, b):
 
     # Cleanup should have happened
     assert not s.extensions["events"]._events
-    assert not s.extensions["events"]._waiter_count
 
 
 @gen_cluster(client=True)
@@ -113,7 +110,6 @@ async def test_set_not_set_many_events(c, s, a, b):
 
     # Cleanup should have happened
     assert not s.extensions["events"]._events
-    assert not s.extensions["events"]._waiter_count
 
 
 @gen_cluster(client=True)
@@ -172,7 +168,6 @@ async def test_event_types(c, s, a, b):
         assert not result
 
     assert not s.extensions["events"]._events
-    assert not s.extensions["events"]._waiter_count
 
 
 @gen_cluster(client=True)
@@ -221,7 +216,6 @@ async def test_two_events_on_workers(c, s, a, b):
     await c.gather(c.submit(event_not_set, "second_event"))
 
     assert not s.extensions["events"]._events
-    assert not s.extensions["events"]._waiter_count
 
 
 @gen_cluster(nthreads=[])
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import pickle
+from collections import deque
+
 import pytest
 
 import dask
 
 from distributed import Worker
+from distributed._stories import (
+    TransitionLog,
+    WorkerLog,
+    scheduler_story,
+    worker_story,
+)
 from distributed.comm import CommClosedError
 from distributed.utils_test import (
     NO_AMM,
@@ -172,3 +181,89 @@ async def test_worker_story_with_deps(c, s, a, b):
         ("dep", "flight", "memory", "memory", {"res": "ready"}),
     ]
     assert_story(story, expected, strict=True)
+
+
+@pytest.mark.parametrize("log_type", [list, WorkerLog])
+def test_worker_story_unhashable_members(log_type):
+    log = log_type(
+        [
+            ("x", "released", "waiting", {"y": "fetch"}, "s1", 1.0),
+            ("gather-dependencies", "tcp://a", {"y"}, "s2", 2.0),
+            ("request-dep", "tcp://a", [["z"], "y"], "s3", 3.0),
+            ("z", "put-in-memory", "s4", 4.0),
+            (("w", 0), "ready", "executing", {}, "s5", 5.0),
+        ]
+    )
+    assert worker_story({"y"}, log) == [log[1], log[2]]
+    assert worker_story(["x", "s4"], log) == [log[0], log[3]]
+    assert worker_story({("w", 0)}, log) == [log[4]]
+    assert worker_story(set(), log) == []
+
+
+@pytest.mark.parametrize("maxlen", [None, 0, 1, 3, 100])
+def test_transition_log_index(maxlen):
+    entries = [
+        ("x", "released", "waiting", {"x": "processing"}, "s1", 1.0),
+        ("y", "released", "waiting", {}, "s1", 2.0),
+        ("x", "waiting", "processing", {}, "s2", 3.0),
+        (("z", 0), "processing", "memory", {"y": "processing"}, "s3", 4.0),
+        ("y", "waiting", "processing", {("z", 0): "released"}, "s3", 5.0),
+    ]
+    log = TransitionLog(maxlen=maxlen)
+    for i, t in enumerate(entries):
+        log.append(t)
+        expect = deque(entries[: i + 1], maxlen=maxlen)
+        assert list(log) == list(expect)
+        for keys in ({"x"}, {"y"}, {("z", 0)}, {"x", "y"}, {"s1"}, set()):
+            assert scheduler_story(keys, log) == scheduler_story(keys, list(expect))
+
+    assert pickle.loads(pickle.dumps(log)) == log
+    log.clear()
+    assert scheduler_story({"x", "y"}, log) == []
+    log.append(entries[0])
+    assert scheduler_story({"x"}, log) == [entries[0]] * (maxlen != 0)
+
+
+def test_worker_log_signatures():
+    assert WorkerLog.append is deque.append
+    log = WorkerLog(maxlen=2)
+    log.append(("x", "compute-task", "s1", 1.0))
+    log.append(("free-keys", ("x", "y"), "s2", 2.0))
+    # Signatures are computed lazily, by the first query
+    assert not log._signatures
+    log.append(("z", "put-in-memory", "s3", 3.0))
+    assert worker_story({"x"}, log) == [log[0]]
+    assert len(log._signatures) == len(log) == 2
+    assert worker_story({"z", "s2"}, log) == list(log)
+    assert pickle.loads(pickle.dumps(log)) == log
+
+    log.clear()
+    assert worker_story({"z"}, log) == []
+    assert not log._signatures
+    log.append(("z", "put-in-memory", "s4", 4.0))
+    assert worker_story({"z"}, log) == [log[0]]
+
+
+def test_worker_log_large_containers():
+    # Messages with many keys aren't hashed key by key, but still match
+    keys = [f"x-{i}" for i in range(1000)]
+    log = WorkerLog([("free-keys", keys, "s1", 1.0), ("y", "ready", "s2", 2.0)])
+    assert worker_story({"x-500"}, log) == [log[0]]
+    assert worker_story({"y"}, log) == [log[1]]
+
+
+def test_transition_log_index_is_lazy():
+    assert TransitionLog.append is deque.append
+    log = TransitionLog(maxlen=3)
+    for i in range(10):
+        log.append((f"x-{i}", "released", "waiting", {"y": "waiting"}, "s", i))
+    assert not log._index
+    assert scheduler_story({"x-8"}, log) == [log[1]]
+    assert len(scheduler_story({"y"}, log)) == 3
+
+    # Positions of evicted entries don't pile up in the index
+    for i in range(10, 1000):
+        log.append((f"x-{i}", "released", "waiting", {"y": "waiting"}, "s", i))
+        assert scheduler_story({f"x-{i}"}, log) == [log[-1]]
+    assert len(log._index["y"]) <= 2 * len(log)
+    assert len(log._index) <= 2 * len(log) + 1
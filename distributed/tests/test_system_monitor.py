@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from time import sleep
 
 import pytest
@@ -129,3 +130,18 @@ def test_gil_contention():
         sm = SystemMonitor()
         a = sm.update()
         assert "gil_contention" not in a
+
+
+def test_range_query_pads_short_quantities():
+    sm = SystemMonitor(maxlen=5)
+    sm.quantities["short"] = deque([1.0], maxlen=1)
+    for _ in range(3):
+        sm.update()
+        sm.quantities["short"].append(sm.count)
+
+    q = sm.range_query(0)
+    assert q["time"] == list(sm.quantities["time"])
+    assert q["short"] == [None, None, None, 4]
+    q = sm.range_query(2)
+    assert q["time"] == list(sm.quantities["time"])[-2:]
+    assert q["short"] == [None, 4]
@@ -34,7 +34,7 @@ from dask._task_spec import Task
 from dask.typing import Key
 from dask.utils import key_split, parse_bytes, typename
 
-from distributed._stories import worker_story
+from distributed._stories import WorkerLog, worker_story
 from distributed.collections import HeapSet
 from distributed.comm import get_address_host
 from distributed.core import ErrorMessage, error_message
@@ -1220,7 +1220,7 @@ class WorkerState:
     #: Transition log: ``[(..., stimulus_id: str | None, timestamp: float), ...]``
     #: The number of stimuli logged is capped.
     #: See also :meth:`story` and :attr:`stimulus_log`.
-    log: deque[tuple]
+    log: WorkerLog
 
     #: Log of all stimuli received by :meth:`handle_stimulus`.
     #: The number of events logged is capped.
@@ -1309,7 +1309,7 @@ class WorkerState:
         self.long_running = set()
         self.transfer_message_bytes_limit = transfer_message_bytes_limit
         maxlen = dask.config.get("distributed.admin.low-level-log-length")
-        self.log = deque(maxlen=maxlen)
+        self.log = WorkerLog(maxlen=maxlen)
         self.stimulus_log = deque(maxlen=maxlen)
         self.task_counter = TaskCounter()
         self.transition_counter = 0